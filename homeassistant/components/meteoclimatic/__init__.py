@@ -1,14 +1,23 @@
 """Support for Meteoclimatic weather data."""
+from datetime import timedelta
 import logging
 
 from meteoclimatic import MeteoclimaticClient
 from meteoclimatic.exceptions import MeteoclimaticError
 
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_SCAN_INTERVAL
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import CONF_STATION_CODE, DOMAIN, PLATFORMS, SCAN_INTERVAL
+from .const import (
+    CONF_STATION_CODE,
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+    PLATFORMS,
+    REQUEST_REFRESH_COOLDOWN_SECONDS,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -16,6 +25,7 @@ _LOGGER = logging.getLogger(__name__)
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up a Meteoclimatic entry."""
     station_code = entry.data[CONF_STATION_CODE]
+    scan_interval = entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
     meteoclimatic_client = MeteoclimaticClient()
 
     async def async_update_data():
@@ -24,7 +34,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             data = await hass.async_add_executor_job(
                 meteoclimatic_client.weather_at_station, station_code
             )
-            return data.__dict__
+            # Only expose what the sensor and weather platforms consume, instead
+            # of the library object's internal state
+            return {"station": data.station, "weather": data.weather}
         except MeteoclimaticError as err:
             raise UpdateFailed(f"Error while retrieving data: {err}") from err
 
@@ -33,19 +45,30 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         _LOGGER,
         name=f"Meteoclimatic weather for {entry.title} ({station_code})",
         update_method=async_update_data,
-        update_interval=SCAN_INTERVAL,
+        update_interval=timedelta(minutes=scan_interval),
+        # Delay requested refreshes so a burst of requests results in a single
+        # fetch from the station feed
+        request_refresh_debouncer=Debouncer(
+            hass, _LOGGER, cooldown=REQUEST_REFRESH_COOLDOWN_SECONDS, immediate=False
+        ),
     )
 
     await coordinator.async_config_entry_first_refresh()
 
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = coordinator
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
+
     return True
 
 
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Handle options update."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
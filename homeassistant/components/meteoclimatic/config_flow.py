@@ -1,13 +1,19 @@
 """Config flow to configure the Meteoclimatic integration."""
+from __future__ import annotations
+
 import logging
+from typing import Any
 
 from meteoclimatic import MeteoclimaticClient
 from meteoclimatic.exceptions import MeteoclimaticError, StationNotFound
 import voluptuous as vol
 
 from homeassistant import config_entries
+from homeassistant.const import CONF_SCAN_INTERVAL
+from homeassistant.core import callback
+from homeassistant.data_entry_flow import FlowResult
 
-from .const import CONF_STATION_CODE, DOMAIN
+from .const import CONF_STATION_CODE, DEFAULT_SCAN_INTERVAL, DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -17,6 +23,14 @@ class MeteoclimaticFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> MeteoclimaticOptionsFlowHandler:
+        """Get the options flow for this handler."""
+        return MeteoclimaticOptionsFlowHandler(config_entry)
+
     def _show_setup_form(self, user_input=None, errors=None):
         """Show the setup form to the user."""
         if user_input is None:
@@ -62,3 +76,32 @@ class MeteoclimaticFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
         return self.async_create_entry(
             title=weather.station.name, data={CONF_STATION_CODE: station_code}
         )
+
+
+class MeteoclimaticOptionsFlowHandler(config_entries.OptionsFlow):
+    """Handle Meteoclimatic options."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize Meteoclimatic options flow."""
+        self.config_entry = config_entry
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the Meteoclimatic options."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        scan_interval = self.config_entry.options.get(
+            CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
+        )
+
+        options_schema = {
+            vol.Optional(CONF_SCAN_INTERVAL, default=scan_interval): vol.All(
+                vol.Coerce(int), vol.Clamp(min=5, max=60)
+            )
+        }
+
+        return self.async_show_form(
+            step_id="init", data_schema=vol.Schema(options_schema)
+        )
@@ -1,8 +1,6 @@
 """Meteoclimatic component constants."""
 from __future__ import annotations
 
-from datetime import timedelta
-
 from meteoclimatic import Condition
 
 from homeassistant.components.weather import (
@@ -30,7 +28,11 @@ ATTRIBUTION = "Data provided by Meteoclimatic"
 MODEL = "Meteoclimatic RSS feed"
 MANUFACTURER = "Meteoclimatic"
 
-SCAN_INTERVAL = timedelta(minutes=10)
+# Scan interval in minutes, matching how often stations publish new data
+DEFAULT_SCAN_INTERVAL = 10
+
+# Cooldown in seconds before a requested refresh is fetched
+REQUEST_REFRESH_COOLDOWN_SECONDS = 1.0
 
 CONF_STATION_CODE = "station_code"
 
@@ -171,6 +171,10 @@ class TomorrowioDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self._api = api
         self.data = {CURRENT: {}, FORECASTS: {}}
         self.entry_id_to_location_dict: dict[str, str] = {}
+        # Current conditions per config entry, rebuilt by _async_update_data on
+        # each refresh so entities don't have to walk the full response on every
+        # state read
+        self.current_by_entry_id: dict[str, dict[str, Any]] = {}
         self._coordinator_ready: asyncio.Event | None = None
 
         super().__init__(hass, LOGGER, name=f"{DOMAIN}_{self._api.api_key_masked}")
@@ -319,6 +323,10 @@ class TomorrowioDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             ) as error:
                 raise UpdateFailed from error
 
+        self.current_by_entry_id = {
+            entry_id: data[entry_id].get(CURRENT, {})
+            for entry_id in self.entry_id_to_location_dict
+        }
         return data
 
 
@@ -337,6 +345,7 @@ class TomorrowioEntity(CoordinatorEntity[TomorrowioDataUpdateCoordinator]):
         super().__init__(coordinator)
         self.api_version = api_version
         self._config_entry = config_entry
+        self._entry_id = config_entry.entry_id
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, self._config_entry.data[CONF_API_KEY])},
             name=INTEGRATION_NAME,
@@ -350,5 +359,4 @@ class TomorrowioEntity(CoordinatorEntity[TomorrowioDataUpdateCoordinator]):
 
         Used for V4 API.
         """
-        entry_id = self._config_entry.entry_id
-        return self.coordinator.data[entry_id].get(CURRENT, {}).get(property_name)
+        return self.coordinator.current_by_entry_id[self._entry_id].get(property_name)
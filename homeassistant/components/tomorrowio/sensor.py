@@ -3,7 +3,8 @@ from __future__ import annotations
 
 from abc import abstractmethod
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import partial
 from typing import Any
 
 from pytomorrowio.const import (
@@ -70,8 +71,12 @@ from .const import (
     TMRW_ATTR_WIND_GUST,
 )
 
+# Options and raw value lookup for enum sensors keyed by value_map, several
+# descriptions share an enum
+_VALUE_MAP_CACHE: dict[type, tuple[list[str], dict[Any, str]]] = {}
 
-@dataclass
+
+@dataclass(slots=True)
 class TomorrowioSensorEntityDescription(SensorEntityDescription):
     """Describes a Tomorrow.io sensor entity."""
 
@@ -85,12 +90,12 @@ class TomorrowioSensorEntityDescription(SensorEntityDescription):
     multiplication_factor: Callable[[float], float] | float | None = None
     imperial_conversion: Callable[[float], float] | float | None = None
     value_map: Any | None = None
+    # Lowercased enum member names keyed by raw value, built from value_map
+    value_lookup: dict[Any, str] | None = field(default=None, init=False, repr=False)
 
     def __post_init__(self) -> None:
         """Handle post init."""
-        if (self.unit_imperial is None and self.unit_metric is not None) or (
-            self.unit_imperial is not None and self.unit_metric is None
-        ):
+        if (self.unit_imperial is None) != (self.unit_metric is None):
             raise ValueError(
                 "Entity descriptions must include both imperial and metric units or "
                 "they must both be None"
@@ -98,14 +103,27 @@ class TomorrowioSensorEntityDescription(SensorEntityDescription):
 
         if self.value_map is not None:
             self.device_class = SensorDeviceClass.ENUM
-            self.options = [item.name.lower() for item in self.value_map]
+            if (cached := _VALUE_MAP_CACHE.get(self.value_map)) is None:
+                cached = _VALUE_MAP_CACHE[self.value_map] = (
+                    [item.name.lower() for item in self.value_map],
+                    {item.value: item.name.lower() for item in self.value_map},
+                )
+            self.options, self.value_lookup = cached
+
+
+# Conversion factors are resolved once at import so that state reads only need a
+# multiplication instead of a full unit conversion
+_KM_TO_MI = DistanceConverter.convert(1.0, UnitOfLength.KILOMETERS, UnitOfLength.MILES)
+_MS_TO_MPH = SpeedConverter.convert(
+    1.0, UnitOfSpeed.METERS_PER_SECOND, UnitOfSpeed.MILES_PER_HOUR
+)
 
 
 # From https://cfpub.epa.gov/ncer_abstracts/index.cfm/fuseaction/display.files/fileID/14285
 # x ug/m^3 = y ppb * molecular weight / 24.45
-def convert_ppb_to_ugm3(molecular_weight: int | float) -> Callable[[float], float]:
-    """Return function to convert ppb to ug/m^3."""
-    return lambda x: (x * molecular_weight) / 24.45
+_OZONE_PPB_TO_UGM3 = 48 / 24.45
+_NITROGEN_DIOXIDE_PPB_TO_UGM3 = 46.01 / 24.45
+_SULPHUR_DIOXIDE_PPB_TO_UGM3 = 64.07 / 24.45
 
 
 SENSOR_TYPES = (
@@ -151,11 +169,7 @@ SENSOR_TYPES = (
         icon="mdi:cloud-arrow-down",
         unit_imperial=UnitOfLength.MILES,
         unit_metric=UnitOfLength.KILOMETERS,
-        imperial_conversion=lambda val: DistanceConverter.convert(
-            val,
-            UnitOfLength.KILOMETERS,
-            UnitOfLength.MILES,
-        ),
+        imperial_conversion=_KM_TO_MI,
     ),
     # Data comes in as km, convert to miles for imperial
     TomorrowioSensorEntityDescription(
@@ -165,11 +179,7 @@ SENSOR_TYPES = (
         icon="mdi:cloud-arrow-up",
         unit_imperial=UnitOfLength.MILES,
         unit_metric=UnitOfLength.KILOMETERS,
-        imperial_conversion=lambda val: DistanceConverter.convert(
-            val,
-            UnitOfLength.KILOMETERS,
-            UnitOfLength.MILES,
-        ),
+        imperial_conversion=_KM_TO_MI,
     ),
     TomorrowioSensorEntityDescription(
         key="cloud_cover",
@@ -186,9 +196,7 @@ SENSOR_TYPES = (
         icon="mdi:weather-windy",
         unit_imperial=UnitOfSpeed.MILES_PER_HOUR,
         unit_metric=UnitOfSpeed.METERS_PER_SECOND,
-        imperial_conversion=lambda val: SpeedConverter.convert(
-            val, UnitOfSpeed.METERS_PER_SECOND, UnitOfSpeed.MILES_PER_HOUR
-        ),
+        imperial_conversion=_MS_TO_MPH,
     ),
     TomorrowioSensorEntityDescription(
         key="precipitation_type",
@@ -205,7 +213,7 @@ SENSOR_TYPES = (
         attribute=TMRW_ATTR_OZONE,
         name="Ozone",
         native_unit_of_measurement=CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
-        multiplication_factor=convert_ppb_to_ugm3(48),
+        multiplication_factor=_OZONE_PPB_TO_UGM3,
         device_class=SensorDeviceClass.OZONE,
     ),
     TomorrowioSensorEntityDescription(
@@ -229,7 +237,7 @@ SENSOR_TYPES = (
         attribute=TMRW_ATTR_NITROGEN_DIOXIDE,
         name="Nitrogen Dioxide",
         native_unit_of_measurement=CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
-        multiplication_factor=convert_ppb_to_ugm3(46.01),
+        multiplication_factor=_NITROGEN_DIOXIDE_PPB_TO_UGM3,
         device_class=SensorDeviceClass.NITROGEN_DIOXIDE,
     ),
     # Data comes in as ppb, convert to ppm
@@ -248,7 +256,7 @@ SENSOR_TYPES = (
         attribute=TMRW_ATTR_SULPHUR_DIOXIDE,
         name="Sulphur Dioxide",
         native_unit_of_measurement=CONCENTRATION_MICROGRAMS_PER_CUBIC_METER,
-        multiplication_factor=convert_ppb_to_ugm3(64.07),
+        multiplication_factor=_SULPHUR_DIOXIDE_PPB_TO_UGM3,
         device_class=SensorDeviceClass.SULPHUR_DIOXIDE,
     ),
     TomorrowioSensorEntityDescription(
@@ -365,6 +373,45 @@ def handle_conversion(
     return round(float(value) * conversion, 2)
 
 
+def _identity(value: float | int) -> float | int:
+    """Return the value unchanged."""
+    return value
+
+
+def _get_compute_strategy(
+    description: TomorrowioSensorEntityDescription, is_imperial: bool
+) -> Callable[[float | int], str | int | float | None]:
+    """Return the function that turns a raw state into the sensor value."""
+    if description.value_lookup is not None:
+        return description.value_lookup.get
+
+    multiplication_factor = description.multiplication_factor
+    imperial_conversion = None
+    # If there is an imperial conversion needed and the instance is using imperial,
+    # apply the conversion logic.
+    if (
+        description.imperial_conversion
+        and description.unit_imperial is not None
+        and description.unit_imperial != description.unit_metric
+        and is_imperial
+    ):
+        imperial_conversion = description.imperial_conversion
+
+    if multiplication_factor is not None and imperial_conversion is not None:
+        factor, conversion = multiplication_factor, imperial_conversion
+
+        def _scale_imperial(value: float | int) -> float:
+            """Apply the multiplication factor followed by the imperial conversion."""
+            return handle_conversion(handle_conversion(value, factor), conversion)
+
+        return _scale_imperial
+    if multiplication_factor is not None:
+        return partial(handle_conversion, conversion=multiplication_factor)
+    if imperial_conversion is not None:
+        return partial(handle_conversion, conversion=imperial_conversion)
+    return _identity
+
+
 class BaseTomorrowioSensorEntity(TomorrowioEntity, SensorEntity):
     """Base Tomorrow.io sensor entity."""
 
@@ -384,10 +431,15 @@ class BaseTomorrowioSensorEntity(TomorrowioEntity, SensorEntity):
         self.entity_description = description
         self._attr_name = f"{self._config_entry.data[CONF_NAME]} - {description.name}"
         self._attr_unique_id = f"{self._config_entry.unique_id}_{description.key}"
+        is_imperial = hass.config.units is US_CUSTOMARY_SYSTEM
         if self.entity_description.native_unit_of_measurement is None:
             self._attr_native_unit_of_measurement = description.unit_metric
-            if hass.config.units is US_CUSTOMARY_SYSTEM:
+            if is_imperial:
                 self._attr_native_unit_of_measurement = description.unit_imperial
+        # The description and unit system don't change for the lifetime of the
+        # entity, so resolve what native_value needs once here.
+        self._attribute = description.attribute
+        self._compute = _get_compute_strategy(description, is_imperial)
 
     @property
     @abstractmethod
@@ -397,29 +449,9 @@ class BaseTomorrowioSensorEntity(TomorrowioEntity, SensorEntity):
     @property
     def native_value(self) -> str | int | float | None:
         """Return the state."""
-        state = self._state
-        desc = self.entity_description
-
-        if state is None:
-            return state
-
-        if desc.value_map is not None:
-            return desc.value_map(state).name.lower()
-
-        if desc.multiplication_factor is not None:
-            state = handle_conversion(state, desc.multiplication_factor)
-
-        # If there is an imperial conversion needed and the instance is using imperial,
-        # apply the conversion logic.
-        if (
-            desc.imperial_conversion
-            and desc.unit_imperial is not None
-            and desc.unit_imperial != desc.unit_metric
-            and self.hass.config.units is US_CUSTOMARY_SYSTEM
-        ):
-            return handle_conversion(state, desc.imperial_conversion)
-
-        return state
+        if (state := self._state) is None:
+            return None
+        return self._compute(state)
 
 
 class TomorrowioSensorEntity(BaseTomorrowioSensorEntity):
@@ -428,6 +460,6 @@ class TomorrowioSensorEntity(BaseTomorrowioSensorEntity):
     @property
     def _state(self) -> int | float | None:
         """Return the raw state."""
-        val = self._get_current_property(self.entity_description.attribute)
+        val = self._get_current_property(self._attribute)
         assert not isinstance(val, str)
         return val
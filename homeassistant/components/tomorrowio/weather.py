@@ -220,7 +220,7 @@ class TomorrowioWeatherEntity(TomorrowioEntity, SingleCoordinatorWeatherEntity):
         """Return the forecast."""
         # Check if forecasts are available
         raw_forecasts = (
-            self.coordinator.data.get(self._config_entry.entry_id, {})
+            self.coordinator.data.get(self._entry_id, {})
             .get(FORECASTS, {})
             .get(forecast_type)
         )
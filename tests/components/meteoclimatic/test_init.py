@@ -0,0 +1,89 @@
+"""Tests for the Meteoclimatic integration."""
+from collections.abc import Generator
+from datetime import timedelta
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+from freezegun.api import FrozenDateTimeFactory
+import pytest
+
+from homeassistant.components.meteoclimatic.const import CONF_STATION_CODE, DOMAIN
+from homeassistant.const import CONF_SCAN_INTERVAL
+from homeassistant.core import HomeAssistant
+
+from tests.common import MockConfigEntry, async_fire_time_changed
+
+TEST_STATION_CODE = "ESCAT4300000043206B"
+TEST_STATION_NAME = "Reus (Tarragona)"
+
+
+@pytest.fixture(name="weather_at_station")
+def mock_weather_at_station() -> Generator[MagicMock, None, None]:
+    """Mock fetching an observation from a station."""
+    with patch(
+        "homeassistant.components.meteoclimatic.MeteoclimaticClient"
+    ) as client_mock:
+        weather_at_station = client_mock.return_value.weather_at_station
+        observation = weather_at_station.return_value
+        observation.station.code = TEST_STATION_CODE
+        observation.station.name = TEST_STATION_NAME
+        yield weather_at_station
+
+
+async def _setup_entry(
+    hass: HomeAssistant, options: dict[str, Any] | None = None
+) -> MockConfigEntry:
+    """Set up a Meteoclimatic config entry."""
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        unique_id=TEST_STATION_CODE,
+        data={CONF_STATION_CODE: TEST_STATION_CODE},
+        options=options or {},
+    )
+    config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    return config_entry
+
+
+async def test_scan_interval_option(
+    hass: HomeAssistant, weather_at_station: MagicMock
+) -> None:
+    """Test the scan interval option is used and changing it reloads the entry."""
+    config_entry = await _setup_entry(hass, options={CONF_SCAN_INTERVAL: 30})
+    coordinator = hass.data[DOMAIN][config_entry.entry_id]
+    assert coordinator.update_interval == timedelta(minutes=30)
+    assert weather_at_station.call_count == 1
+
+    hass.config_entries.async_update_entry(
+        config_entry, options={CONF_SCAN_INTERVAL: 15}
+    )
+    await hass.async_block_till_done()
+
+    # The entry was reloaded with a new coordinator using the new interval
+    assert hass.data[DOMAIN][config_entry.entry_id] is not coordinator
+    assert hass.data[DOMAIN][config_entry.entry_id].update_interval == timedelta(
+        minutes=15
+    )
+    assert weather_at_station.call_count == 2
+
+
+async def test_request_refresh_debounced(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    weather_at_station: MagicMock,
+) -> None:
+    """Test requested refreshes are delayed and coalesced into a single fetch."""
+    config_entry = await _setup_entry(hass)
+    coordinator = hass.data[DOMAIN][config_entry.entry_id]
+    weather_at_station.reset_mock()
+
+    await coordinator.async_request_refresh()
+    await coordinator.async_request_refresh()
+    await hass.async_block_till_done()
+    assert weather_at_station.call_count == 0
+
+    freezer.tick(timedelta(seconds=1))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert weather_at_station.call_count == 1
@@ -1,5 +1,6 @@
 """Tests for Tomorrow.io init."""
 from datetime import timedelta
+import json
 
 from freezegun.api import FrozenDateTimeFactory
 
@@ -8,18 +9,36 @@ from homeassistant.components.tomorrowio.config_flow import (
     _get_unique_id,
 )
 from homeassistant.components.tomorrowio.const import CONF_TIMESTEP, DOMAIN
-from homeassistant.components.weather import DOMAIN as WEATHER_DOMAIN
+from homeassistant.components.weather import (
+    ATTR_WEATHER_TEMPERATURE,
+    DOMAIN as WEATHER_DOMAIN,
+)
 from homeassistant.config_entries import SOURCE_USER
 from homeassistant.const import CONF_API_KEY, CONF_NAME
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, State
+from homeassistant.helpers import entity_registry as er
 
 from .const import MIN_CONFIG
 
-from tests.common import MockConfigEntry, async_fire_time_changed
+from tests.common import MockConfigEntry, async_fire_time_changed, load_fixture
 
 NEW_NAME = "New Name"
 
 
+def _get_weather_state(hass: HomeAssistant, config_entry: MockConfigEntry) -> State:
+    """Return the state of the enabled weather entity of a config entry."""
+    states = [
+        state
+        for entity_entry in er.async_entries_for_config_entry(
+            er.async_get(hass), config_entry.entry_id
+        )
+        if entity_entry.domain == WEATHER_DOMAIN
+        and (state := hass.states.get(entity_entry.entity_id))
+    ]
+    assert len(states) == 1
+    return states[0]
+
+
 async def test_load_and_unload(hass: HomeAssistant) -> None:
     """Test loading and unloading entry."""
     data = _get_config_schema(hass, SOURCE_USER)(MIN_CONFIG)
@@ -76,6 +95,14 @@ async def test_update_intervals(
     assert len(tomorrowio_config_entry_update.call_args_list) == 1
 
     tomorrowio_config_entry_update.reset_mock()
+    temperature = _get_weather_state(hass, config_entry).attributes[
+        ATTR_WEATHER_TEMPERATURE
+    ]
+
+    # Data fetched by the partial refresh for the second entry only
+    new_data = json.loads(load_fixture("v4.json", "tomorrowio"))
+    new_data["current"]["temperature"] = 20
+    tomorrowio_config_entry_update.return_value = new_data
 
     # Adding a second config entry should cause the update interval to double
     config_entry_2 = MockConfigEntry(
@@ -92,6 +119,15 @@ async def test_update_intervals(
     # We should get an immediate call once the new config entry is setup for a
     # partial update
     assert len(tomorrowio_config_entry_update.call_args_list) == 1
+    # Each entry's entities read the current conditions fetched for that entry
+    assert (
+        _get_weather_state(hass, config_entry).attributes[ATTR_WEATHER_TEMPERATURE]
+        == temperature
+    )
+    assert (
+        _get_weather_state(hass, config_entry_2).attributes[ATTR_WEATHER_TEMPERATURE]
+        == 20
+    )
 
     tomorrowio_config_entry_update.reset_mock()
 
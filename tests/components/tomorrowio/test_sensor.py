@@ -2,7 +2,9 @@
 from __future__ import annotations
 
 from datetime import datetime
+import json
 from typing import Any
+from unittest.mock import MagicMock
 
 from freezegun import freeze_time
 import pytest
@@ -18,10 +20,14 @@ from homeassistant.components.tomorrowio.const import (
     DEFAULT_NAME,
     DEFAULT_TIMESTEP,
     DOMAIN,
+    TMRW_ATTR_PRECIPITATION_TYPE,
+)
+from homeassistant.components.tomorrowio.sensor import (
+    TomorrowioSensorEntityDescription,
+    _get_compute_strategy,
 )
-from homeassistant.components.tomorrowio.sensor import TomorrowioSensorEntityDescription
 from homeassistant.config_entries import RELOAD_AFTER_UPDATE_DELAY, SOURCE_USER
-from homeassistant.const import ATTR_ATTRIBUTION, CONF_NAME
+from homeassistant.const import ATTR_ATTRIBUTION, CONF_NAME, STATE_UNKNOWN
 from homeassistant.core import HomeAssistant, State, callback
 from homeassistant.helpers.entity_registry import async_get
 from homeassistant.util import dt as dt_util
@@ -29,7 +35,7 @@ from homeassistant.util.unit_system import US_CUSTOMARY_SYSTEM
 
 from .const import API_V4_ENTRY_DATA
 
-from tests.common import MockConfigEntry, async_fire_time_changed
+from tests.common import MockConfigEntry, async_fire_time_changed, load_fixture
 
 CC_SENSOR_ENTITY_ID = "sensor.tomorrow_io_{}"
 
@@ -213,7 +219,33 @@ async def test_v4_sensor_imperial(hass: HomeAssistant) -> None:
     check_sensor_state(hass, UV_HEALTH_CONCERN, "moderate")
 
 
+async def test_v4_sensor_unknown_enum_value(
+    hass: HomeAssistant, tomorrowio_config_entry_update: MagicMock
+) -> None:
+    """Test v4 enum sensor with a value that is not part of the enum."""
+    data = json.loads(load_fixture("v4.json", "tomorrowio"))
+    data["current"][TMRW_ATTR_PRECIPITATION_TYPE] = 99
+    tomorrowio_config_entry_update.return_value = data
+    await _setup(hass, [PRECIPITATION_TYPE], API_V4_ENTRY_DATA)
+    check_sensor_state(hass, PRECIPITATION_TYPE, STATE_UNKNOWN)
+
+
 async def test_entity_description() -> None:
     """Test improper entity description raises."""
     with pytest.raises(ValueError):
         TomorrowioSensorEntityDescription("a", unit_imperial="b")
+
+
+async def test_multiplication_factor_and_imperial_conversion() -> None:
+    """Test a description with both a multiplication factor and imperial conversion."""
+    description = TomorrowioSensorEntityDescription(
+        "a",
+        unit_imperial="b",
+        unit_metric="c",
+        multiplication_factor=2,
+        imperial_conversion=lambda val: val * 3,
+    )
+    # Metric only applies the multiplication factor
+    assert _get_compute_strategy(description, False)(1.111) == 2.22
+    # Imperial applies the imperial conversion to the rounded, multiplied value
+    assert _get_compute_strategy(description, True)(1.111) == 6.66